@@ -1,15 +1,28 @@
 from __future__ import annotations
 
-import re
+import sys
 from datetime import datetime
 from typing import Any, Optional
 
-ROOT_RE = re.compile(r"root='([^']+)'")
+RUN_TYPES = frozenset({"Run", "TrailRun", "VirtualRun"})
 
-RUN_TYPES = {"Run", "TrailRun", "VirtualRun"}
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing "Z" natively from 3.11 on.
+    _fromisoformat = datetime.fromisoformat
+else:
+
+    def _fromisoformat(s: str) -> datetime:
+        if s.endswith("Z"):
+            s = s[:-1] + "+00:00"
+        return datetime.fromisoformat(s)
 
 
 def is_run(activity: dict) -> bool:
+    # Common case: a plain non-empty 'type' string, checked without the
+    # activity_type() call and its 'sport_type' fallback.
+    t = activity.get("type")
+    if type(t) is str and t:
+        return t in RUN_TYPES
     return activity_type(activity) in RUN_TYPES
 
 
@@ -89,7 +102,7 @@ def parse_iso_datetime(dt_str: Any) -> Optional[datetime]:
         return None
 
     try:
-        return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+        return _fromisoformat(dt_str)
     except ValueError:
         return None
 
@@ -1,23 +1,121 @@
 from __future__ import annotations
 
-import json
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import os
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterator, Optional, TypeVar
 
+from activity_archive.jsonio import loads
 
-def iter_activity_dicts(archive_dir: Path) -> Iterator[dict[str, Any]]:
+T = TypeVar("T")
+
+# Archive reads are many small files; overlap them on a few threads once
+# there are enough files for the pool overhead to pay off.
+READ_WORKERS = 8
+READ_AHEAD = 64
+PARALLEL_MIN_FILES = 32
+
+# Parse+transform is CPU-bound; spread it across processes only for archives
+# big enough to amortize worker startup and result pickling.
+PROCESS_MIN_FILES = 512
+PROCESS_CHUNKSIZE = 64
+
+
+def json_file_paths(archive_dir: Path) -> list[str]:
+    """Return archive_dir/*.json paths as strings, sorted by filename."""
+    with os.scandir(archive_dir) as it:
+        return sorted(e.path for e in it if e.name.endswith(".json"))
+
+
+def json_file_stats(archive_dir: Path) -> list[tuple[str, int, int]]:
     """
-    Yield activity JSON dicts from archive_dir/*.json.
-    Skips unreadable files and non-dict JSON.
+    Return (path, st_mtime_ns, st_size) for each archive_dir/*.json file,
+    sorted by filename. Files removed mid-listing are left out.
+    """
+    stats = []
+    with os.scandir(archive_dir) as it:
+        for e in it:
+            if not e.name.endswith(".json"):
+                continue
+            try:
+                st = e.stat()
+            except FileNotFoundError:
+                continue
+            stats.append((e.path, st.st_mtime_ns, st.st_size))
+    stats.sort()
+    return stats
+
+
+def map_archive_files(fn: Callable[[str], T], archive_dir: Path) -> Iterator[T]:
+    """
+    Yield fn(path) for each archive_dir/*.json path, in filename order.
+    Calls run on a small thread pool for larger directories.
+    """
+    if not archive_dir.exists():
+        return
+
+    yield from _thread_map(fn, json_file_paths(archive_dir))
+
+
+def _thread_map(fn: Callable[[str], T], paths: list[str]) -> Iterator[T]:
+    if len(paths) < PARALLEL_MIN_FILES:
+        yield from map(fn, paths)
+        return
+
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        pending: deque[Future[T]] = deque()
+        for path in paths:
+            pending.append(executor.submit(fn, path))
+            if len(pending) >= READ_AHEAD:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def map_archive_files_cpu(fn: Callable[[str], T], archive_dir: Path) -> Iterator[T]:
+    """
+    Like map_archive_files, but runs fn in a process pool when there are
+    several cores and enough files. fn must be a picklable top-level function.
     """
     if not archive_dir.exists():
         return
 
-    for p in sorted(archive_dir.glob("*.json")):
-        try:
-            data = json.loads(p.read_text(encoding="utf-8"))
-        except Exception:
-            continue
+    yield from map_paths_cpu(fn, json_file_paths(archive_dir))
+
+
+def map_paths_cpu(fn: Callable[[str], T], paths: list[str]) -> Iterator[T]:
+    """map_archive_files_cpu over an explicit list of paths, in list order."""
+    workers = os.cpu_count() or 1
+
+    if workers < 2 or len(paths) < PROCESS_MIN_FILES:
+        yield from _thread_map(fn, paths)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(fn, paths, chunksize=PROCESS_CHUNKSIZE)
+
+
+def _load_json_file(path: str) -> Any:
+    try:
+        with open(path, "rb") as f:
+            return loads(f.read())
+    except Exception:
+        return None
+
+
+def load_activity_dict(path: str) -> Optional[dict[str, Any]]:
+    """Load one archived activity; None if unreadable or not a JSON object."""
+    data = _load_json_file(path)
+    return data if isinstance(data, dict) else None
+
+
+def iter_activity_dicts(archive_dir: Path) -> Iterator[dict[str, Any]]:
+    """
+    Yield activity JSON dicts from archive_dir/*.json.
+    Skips unreadable files and non-dict JSON.
+    """
+    for data in map_archive_files(_load_json_file, archive_dir):
         if isinstance(data, dict):
             yield data
 
@@ -25,4 +123,5 @@ def iter_activity_dicts(archive_dir: Path) -> Iterator[dict[str, Any]]:
 def count_json_files(archive_dir: Path) -> int:
     if not archive_dir.exists():
         return 0
-    return sum(1 for _ in archive_dir.glob("*.json"))
+    with os.scandir(archive_dir) as it:
+        return sum(1 for e in it if e.name.endswith(".json"))
@@ -0,0 +1,202 @@
+"""
+SQLite summary index of the activity archive.
+
+archive/index/activities.sqlite holds one row of commonly used fields per
+archived JSON file so tools can answer simple questions (e.g. the newest
+start_date) without opening every file.
+
+The JSON archive stays the source of truth. Each row records its file's
+mtime and size, and the index is rebuilt from the archive whenever it is
+missing, unreadable, or any file was added, removed or changed since.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sqlite3
+from typing import Any, Optional
+
+from activity_archive.activity import activity_type, parse_iso_datetime
+from activity_archive.archive import json_file_stats, load_activity_dict, map_paths_cpu
+from activity_archive.paths import ACTIVITIES_DIR, ACTIVITY_DB_PATH
+from activity_archive.units import safe_float, safe_int
+
+# Bump when the table layout changes; older files are dropped and rebuilt.
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS activities (
+    file TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    id INTEGER,
+    start_date TEXT,
+    start_date_local TEXT,
+    type TEXT,
+    distance REAL,
+    moving_time INTEGER,
+    name TEXT
+);
+"""
+
+UPSERT_SQL = """
+INSERT OR REPLACE INTO activities
+    (file, mtime_ns, size, id, start_date, start_date_local, type, distance, moving_time, name)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Columns after (file, mtime_ns, size) for files that aren't a JSON object.
+_EMPTY_FIELDS = (None,) * 7
+
+_SQLITE_INT_MIN = -(2**63)
+_SQLITE_INT_MAX = 2**63 - 1
+
+
+def _iso_or_none(v: Any) -> Optional[str]:
+    # Normalize so MIN/MAX on the TEXT column orders chronologically
+    # regardless of "Z" vs "+00:00" spelling in the source JSON.
+    dt = parse_iso_datetime(v)
+    return dt.isoformat() if dt else None
+
+
+def _int_or_none(v: int) -> Optional[int]:
+    # SQLite integers are 64-bit; anything wider can't be stored.
+    return v if _SQLITE_INT_MIN <= v <= _SQLITE_INT_MAX else None
+
+
+def _file_stem(path: str) -> str:
+    return os.path.basename(path)[:-5]
+
+
+def index_fields(data: dict[str, Any]) -> tuple[Any, ...]:
+    name = data.get("name")
+    return (
+        _int_or_none(safe_int(data.get("id"))) or None,
+        _iso_or_none(data.get("start_date")),
+        _iso_or_none(data.get("start_date_local")),
+        activity_type(data),
+        safe_float(data.get("distance")),
+        _int_or_none(safe_int(data.get("moving_time"))),
+        name.strip() if isinstance(name, str) else "",
+    )
+
+
+def _load_index_fields(path: str) -> tuple[Any, ...]:
+    data = load_activity_dict(path)
+    return index_fields(data) if data is not None else _EMPTY_FIELDS
+
+
+def file_stats_by_stem(stats: list[tuple[str, int, int]]) -> dict[str, tuple[int, int]]:
+    """Map json_file_stats() output to {filename stem: (mtime_ns, size)}."""
+    return {_file_stem(path): (mtime_ns, size) for path, mtime_ns, size in stats}
+
+
+def indexed_file_stats(conn: sqlite3.Connection) -> dict[str, tuple[int, int]]:
+    """Return {filename stem: (mtime_ns, size)} as recorded in the index."""
+    return {
+        file: (mtime_ns, size)
+        for file, mtime_ns, size in conn.execute("SELECT file, mtime_ns, size FROM activities")
+    }
+
+
+def is_current(conn: sqlite3.Connection, stats: list[tuple[str, int, int]]) -> bool:
+    """True if the index has exactly these files with the same mtime and size."""
+    return indexed_file_stats(conn) == file_stats_by_stem(stats)
+
+
+def rebuild(conn: sqlite3.Connection, activities_dir: Path = ACTIVITIES_DIR) -> int:
+    """Repopulate the index from the JSON archive. Returns rows written."""
+    # Stat before reading, so a file changed mid-rebuild looks stale next time.
+    stats = json_file_stats(activities_dir) if activities_dir.exists() else []
+    fields = map_paths_cpu(_load_index_fields, [path for path, _, _ in stats])
+
+    rows = [
+        (_file_stem(path), mtime_ns, size) + row
+        for (path, mtime_ns, size), row in zip(stats, fields)
+    ]
+
+    with conn:
+        conn.execute("DELETE FROM activities")
+        conn.executemany(UPSERT_SQL, rows)
+
+    return len(rows)
+
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    if version != SCHEMA_VERSION:
+        conn.executescript("DROP TABLE IF EXISTS activities; DROP TABLE IF EXISTS meta;")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.executescript(SCHEMA)
+
+
+def connect(
+    db_path: Path = ACTIVITY_DB_PATH,
+    activities_dir: Path = ACTIVITIES_DIR,
+) -> sqlite3.Connection:
+    """Open the index, rebuilding it first if it is missing or out of date."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    try:
+        _create_schema(conn)
+    except sqlite3.OperationalError:
+        # Locked, read-only, I/O errors: the file may be fine, so keep it.
+        conn.close()
+        raise
+    except sqlite3.DatabaseError:
+        # "file is not a database" / "malformed": the index is derived, so
+        # replace it.
+        conn.close()
+        db_path.unlink(missing_ok=True)
+        conn = sqlite3.connect(db_path)
+        _create_schema(conn)
+
+    stats = json_file_stats(activities_dir) if activities_dir.exists() else []
+    if not is_current(conn, stats):
+        rebuild(conn, activities_dir)
+
+    return conn
+
+
+def open_existing(db_path: Path = ACTIVITY_DB_PATH) -> Optional[sqlite3.Connection]:
+    """Open the index read-only without creating or rebuilding it; None if missing."""
+    if not db_path.exists():
+        return None
+    try:
+        conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return None
+    try:
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+    except sqlite3.Error:
+        version = None
+    if version != SCHEMA_VERSION:
+        conn.close()
+        return None
+    return conn
+
+
+def file_types(conn: sqlite3.Connection) -> dict[str, tuple[int, int, Optional[str]]]:
+    """Return {filename stem: (mtime_ns, size, type)} for every indexed file."""
+    return {
+        file: (mtime_ns, size, typ)
+        for file, mtime_ns, size, typ in conn.execute(
+            "SELECT file, mtime_ns, size, type FROM activities"
+        )
+    }
+
+
+def upsert_activity(conn: sqlite3.Connection, path: Path, data: dict[str, Any]) -> None:
+    """Record a just-written archive file in the index."""
+    st = path.stat()
+    with conn:
+        conn.execute(
+            UPSERT_SQL,
+            (_file_stem(str(path)), st.st_mtime_ns, st.st_size) + index_fields(data),
+        )
+
+
+def start_date_bounds(conn: sqlite3.Connection) -> tuple[Optional[str], Optional[str]]:
+    """Return (oldest, newest) indexed start_date as ISO strings."""
+    return conn.execute("SELECT MIN(start_date), MAX(start_date) FROM activities").fetchone()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+def loads(raw: bytes) -> Any:
+    """Parse JSON from bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json.dump writes by
+            # default; older archive files may contain them.
+            pass
+    return json.loads(raw)
+
+
+def dumps_pretty(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize data as 2-space indented UTF-8 JSON with a trailing newline.
+    Matches json.dump(data, indent=2, ensure_ascii=False) + "\\n".
+
+    default is called for objects the encoder can't serialize natively.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        try:
+            return orjson.dumps(data, default=default, option=option)
+        except orjson.JSONEncodeError:
+            # Non-str dict keys (possible in non-JSON model dumps) are coerced
+            # to str by orjson itself; the option is slower, so only retry with it.
+            return orjson.dumps(data, default=default, option=option | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(data, indent=2, ensure_ascii=False, default=default) + "\n").encode("utf-8")
+
+
+def atomic_write_json(
+    path: Path,
+    data: Any,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> None:
+    """
+    Write JSON to path atomically: write to .tmp then rename.
+    The payload is serialized up front and written with a single write().
+    """
+    payload = dumps_pretty(data, default=default)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    tmp_path.replace(path)
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file as raw bytes (no str decode step)."""
+    return loads(path.read_bytes())
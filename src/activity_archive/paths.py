@@ -9,6 +9,7 @@ STREAMS_DIR = ARCHIVE_DIR / "streams"
 INDEX_DIR = ARCHIVE_DIR / "index"
 
 ACTIVITY_INDEX_PATH = INDEX_DIR / "activity_index.json"
+ACTIVITY_DB_PATH = INDEX_DIR / "activities.sqlite"
 
 # --- Generated outputs ---
 DERIVED_DIR = PROJECT_ROOT / "derived"
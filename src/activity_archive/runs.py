@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from contextlib import closing
+from operator import itemgetter
+import os
+from pathlib import Path
+import sqlite3
+from typing import NamedTuple, Optional
+
+from activity_archive import index_db
+from activity_archive.activity import RUN_TYPES, is_run, parse_iso_datetime
+from activity_archive.archive import json_file_stats, load_activity_dict, map_paths_cpu
+from activity_archive.paths import ACTIVITIES_DIR
+from activity_archive.units import meters_to_miles, pace_mmss, safe_float, safe_int
+
+MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+class RunRow(NamedTuple):
+    date_str: str
+    dist_mi: float
+    pace_mmss: str
+    moving_seconds: int
+
+
+def run_row(activity: dict) -> RunRow | None:
+    if not is_run(activity):
+        return None
+
+    dt_local = parse_iso_datetime(activity.get("start_date_local")) or parse_iso_datetime(
+        activity.get("start_date")
+    )
+    if dt_local is None:
+        return None
+
+    d = dt_local.date()
+    meters = safe_float(activity.get("distance"))
+    dist_mi = meters_to_miles(meters)
+    moving_seconds = safe_int(activity.get("moving_time"))
+    pace = pace_mmss(dist_mi, moving_seconds)
+
+    return RunRow(
+        date_str=d.isoformat(),
+        dist_mi=dist_mi,
+        pace_mmss=pace,
+        moving_seconds=moving_seconds,
+    )
+
+
+def _load_run_row(path: str) -> RunRow | None:
+    activity = load_activity_dict(path)
+    return run_row(activity) if activity is not None else None
+
+
+def _indexed_run_paths(
+    activities_dir: Path, stats: list[tuple[str, int, int]]
+) -> Optional[list[str]]:
+    """
+    Filter archive files down to runs using the SQLite index, so non-run
+    files are never opened. Returns None unless every file in stats has an
+    index row with the same mtime and size, in which case callers fall
+    back to a full scan.
+    """
+    if activities_dir != ACTIVITIES_DIR:
+        return None
+
+    conn = index_db.open_existing()
+    if conn is None:
+        return None
+
+    try:
+        with closing(conn):
+            indexed = index_db.file_types(conn)
+    except sqlite3.Error:
+        return None
+
+    if len(indexed) != len(stats):
+        return None
+
+    run_paths = []
+    for path, mtime_ns, size in stats:
+        entry = indexed.get(os.path.basename(path)[:-5])
+        if entry is None or entry[0] != mtime_ns or entry[1] != size:
+            return None
+        if entry[2] in RUN_TYPES:
+            run_paths.append(path)
+
+    return run_paths
+
+
+def load_runs_by_month(activities_dir: Path) -> dict[tuple[int, int], list[RunRow]]:
+    if not activities_dir.exists():
+        raise FileNotFoundError(f"Missing activities archive dir: {activities_dir}")
+
+    stats = json_file_stats(activities_dir)
+    paths = _indexed_run_paths(activities_dir, stats)
+    if paths is None:
+        paths = [path for path, _, _ in stats]
+
+    runs = [rr for rr in map_paths_cpu(_load_run_row, paths) if rr is not None]
+
+    # Sort once so every month's list comes out newest-first (stable on ties).
+    runs.sort(key=itemgetter(0), reverse=True)
+
+    by_month: dict[tuple[int, int], list[RunRow]] = defaultdict(list)
+    for rr in runs:
+        by_month[(int(rr.date_str[:4]), int(rr.date_str[5:7]))].append(rr)
+
+    return by_month
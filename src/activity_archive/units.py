@@ -15,6 +15,13 @@ def safe_float(v: Any, default: float = 0.0) -> float:
     - nan → default
     - invalid strings → default
     """
+    # Exact-type checks first: archive values are almost always plain
+    # floats/ints, and v != v is the NaN test without a math.isnan call.
+    t = type(v)
+    if t is float:
+        return default if v != v else v
+    if t is int:
+        return float(v)
     if v is None:
         return default
     if isinstance(v, (int, float)):
@@ -34,6 +41,8 @@ def safe_int(v: Any, default: int = 0) -> int:
     - int → unchanged
     - float or numeric string → int(float(v))
     """
+    if type(v) is int:
+        return v
     if v is None:
         return default
     if isinstance(v, bool):
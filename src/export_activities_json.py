@@ -30,53 +30,43 @@ Recommended workflow:
 from __future__ import annotations
 
 import argparse
-import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+import os
+import sqlite3
 import time
 from datetime import datetime
+from operator import methodcaller
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 from client import get_client
+from activity_archive import index_db, jsonio
+from activity_archive.activity import parse_iso_datetime
+from activity_archive.jsonio import read_json
 from activity_archive.paths import ACTIVITIES_DIR, ACTIVITY_INDEX_PATH
 
+# get_activity calls are independent HTTP round trips; a few in flight at once
+# overlap latency without changing how many requests count against the limit.
+DEFAULT_FETCH_WORKERS = 5
+
 
 def parse_iso(dt_str: str) -> Optional[datetime]:
     """Parse an ISO datetime string. Returns None if invalid."""
-    try:
-        return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-    except Exception:
-        return None
+    return parse_iso_datetime(dt_str)
 
 
 def get_archive_bounds(
-    dir_path: Path = ACTIVITIES_DIR,
+    index_conn: sqlite3.Connection,
 ) -> tuple[Optional[datetime], Optional[datetime]]:
     """
-    Return (oldest_start_date_utc, newest_start_date_utc) from archived JSON.
-    Uses the 'start_date' (UTC) field written in the archive.
+    Return (oldest_start_date_utc, newest_start_date_utc) of archived activities.
+    Reads MIN/MAX 'start_date' from the archive summary index instead of
+    opening every JSON file.
     """
-    oldest: Optional[datetime] = None
-    newest: Optional[datetime] = None
-
-    for path in dir_path.glob("*.json"):
-        data = load_json(path)
-        if data is None:
-            continue
-
-        d = data.get("start_date")
-        if not isinstance(d, str):
-            continue
-
-        dt = parse_iso(d)
-        if dt is None:
-            continue
-
-        if oldest is None or dt < oldest:
-            oldest = dt
-        if newest is None or dt > newest:
-            newest = dt
-
-    return oldest, newest
+    oldest, newest = index_db.start_date_bounds(index_conn)
+    return parse_iso(oldest), parse_iso(newest)
 
 
 def activity_to_dict(activity: Any) -> dict[str, Any]:
@@ -107,27 +97,55 @@ def activity_to_dict(activity: Any) -> dict[str, Any]:
     return data
 
 
+_JSON_DEFAULT_BY_TYPE: dict[type, Callable[[Any], Any]] = {}
+
+
+def json_default(obj: Any) -> Any:
+    """
+    Serialize values left over by the non-JSON activity_to_dict fallbacks
+    (e.g. pint quantities). Containers, datetimes and enums are handled by
+    the encoder itself.
+
+    The converter is picked once per concrete type and cached.
+    """
+    t = type(obj)
+    fn = _JSON_DEFAULT_BY_TYPE.get(t)
+    if fn is None:
+        fn = methodcaller("isoformat") if hasattr(obj, "isoformat") else str
+        _JSON_DEFAULT_BY_TYPE[t] = fn
+    return fn(obj)
+
+
 def atomic_write_json(path: Path, data: dict[str, Any]) -> None:
     """Write JSON atomically via a temporary file then rename."""
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    with tmp_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
-    tmp_path.replace(path)
+    jsonio.atomic_write_json(path, data, default=json_default)
+
+
+def save_activity(index_conn: sqlite3.Connection, path: Path, data: dict[str, Any]) -> None:
+    """Write an activity file and record it in the archive summary index."""
+    atomic_write_json(path, data)
+    index_db.upsert_activity(index_conn, path, data)
 
 
 def load_json(path: Path) -> Optional[dict[str, Any]]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = read_json(path)
         return data if isinstance(data, dict) else None
     except Exception:
         return None
 
 
+def get_archived_ids() -> set[str]:
+    """Return ids of archived activities (filename stems) from one directory scan."""
+    if not ACTIVITIES_DIR.exists():
+        return set()
+    with os.scandir(ACTIVITIES_DIR) as it:
+        return {e.name[:-5] for e in it if e.name.endswith(".json")}
+
+
 def load_activity_index_items() -> list[dict[str, Any]]:
     try:
-        with ACTIVITY_INDEX_PATH.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(ACTIVITY_INDEX_PATH)
         return data if isinstance(data, list) else []
     except Exception:
         return []
@@ -149,9 +167,7 @@ def write_activity_index_map(index_map: dict[int, dict[str, Any]]) -> None:
     items.sort(key=lambda x: parse_iso(x.get("start_date")) or datetime.min)
 
     ACTIVITY_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with ACTIVITY_INDEX_PATH.open("w", encoding="utf-8") as f:
-        json.dump(items, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    jsonio.atomic_write_json(ACTIVITY_INDEX_PATH, items)
 
 
 def update_activity_index_map(
@@ -256,7 +272,7 @@ def count_refresh_remaining() -> int:
     return len(get_refresh_candidates())
 
 
-def reset_all_refresh_flags() -> int:
+def reset_all_refresh_flags(index_conn: sqlite3.Connection) -> int:
     """Set recently_refreshed = false for all archived JSON files."""
     n_reset = 0
 
@@ -265,13 +281,63 @@ def reset_all_refresh_flags() -> int:
         if data is None:
             continue
         set_recently_refreshed(data, False)
-        atomic_write_json(path, data)
+        save_activity(index_conn, path, data)
         n_reset += 1
 
     return n_reset
 
 
-def run_backfill_mode(client: Any, limit: Optional[int], sleep_seconds: float) -> None:
+def iter_fetched_activities(
+    client: Any,
+    activity_ids: Iterable[int],
+    remaining: Optional[Callable[[], int]],
+    workers: int,
+    sleep_seconds: float,
+) -> Iterator[tuple[int, Any, Optional[Exception]]]:
+    """
+    Fetch DetailedActivity objects with up to `workers` requests in flight.
+
+    Yields (activity_id, detailed, error) in input order so writes stay
+    sequential. remaining(), if given, returns how many more files the
+    caller still wants written; no more ids are taken once the requests in
+    flight would cover it. sleep_seconds spaces out submissions, not
+    completions.
+    """
+    ids = iter(activity_ids)
+    pending: deque[tuple[int, Future[Any]]] = deque()
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        while True:
+            while len(pending) < max(workers, 1) and (
+                remaining is None or len(pending) < remaining()
+            ):
+                activity_id = next(ids, None)
+                if activity_id is None:
+                    break
+                pending.append((activity_id, executor.submit(client.get_activity, activity_id)))
+                if sleep_seconds > 0:
+                    time.sleep(sleep_seconds)
+
+            if not pending:
+                return
+
+            activity_id, future = pending.popleft()
+            try:
+                detailed = future.result()
+            except Exception as e:
+                yield activity_id, None, e
+                continue
+
+            yield activity_id, detailed, None
+
+
+def run_backfill_mode(
+    client: Any,
+    index_conn: sqlite3.Connection,
+    limit: Optional[int],
+    sleep_seconds: float,
+    workers: int = DEFAULT_FETCH_WORKERS,
+) -> None:
     print("Mode: backfill-from-index")
 
     if not ACTIVITY_INDEX_PATH.exists():
@@ -286,7 +352,7 @@ def run_backfill_mode(client: Any, limit: Optional[int], sleep_seconds: float) -
     items = list(index_map.values())
     items.sort(key=lambda x: parse_iso(x.get("start_date")) or datetime.min)
 
-    existing_ids = {path.stem for path in ACTIVITIES_DIR.glob("*.json")}
+    existing_ids = get_archived_ids()
 
     print(f"Index size: {len(items)}")
     print(f"Already archived: {len(existing_ids)}")
@@ -297,45 +363,57 @@ def run_backfill_mode(client: Any, limit: Optional[int], sleep_seconds: float) -
     n_errors = 0
     index_changed = False
 
-    try:
-        for item in items:
-            if limit is not None and n_written >= limit:
-                break
+    def iter_missing_ids() -> Iterator[int]:
+        # Pulled lazily by the fetch pool, so the counts cover only the items
+        # visited before --limit files were written.
+        nonlocal n_checked, n_skipped_existing
 
+        for item in items:
             raw_id = item.get("id")
             if raw_id is None:
                 continue
 
-            activity_id = str(raw_id)
             n_checked += 1
 
-            if activity_id in existing_ids:
+            if str(raw_id) in existing_ids:
                 n_skipped_existing += 1
                 continue
 
+            yield int(raw_id)
+
+    def remaining() -> int:
+        return limit - n_written
+
+    try:
+        for activity_id, detailed, error in iter_fetched_activities(
+            client,
+            iter_missing_ids(),
+            remaining if limit is not None else None,
+            workers,
+            sleep_seconds,
+        ):
             try:
-                detailed = client.get_activity(int(activity_id))
+                if error is not None:
+                    raise error
+
                 data = activity_to_dict(detailed)
 
                 out_path = ACTIVITIES_DIR / f"{activity_id}.json"
-                atomic_write_json(out_path, data)
+                save_activity(index_conn, out_path, data)
 
                 start_date = data.get("start_date")
                 update_activity_index_map(
                     index_map,
-                    int(activity_id),
+                    activity_id,
                     start_date if isinstance(start_date, str) else None,
                 )
                 index_changed = True
 
-                existing_ids.add(activity_id)
+                existing_ids.add(str(activity_id))
                 n_written += 1
 
                 print(f"Wrote {activity_id}")
 
-                if sleep_seconds > 0:
-                    time.sleep(sleep_seconds)
-
             except Exception as e:
                 n_errors += 1
                 print(f"{activity_id}: ERROR: {e}")
@@ -351,10 +429,16 @@ def run_backfill_mode(client: Any, limit: Optional[int], sleep_seconds: float) -
     )
 
 
-def run_refresh_mode(client: Any, limit: Optional[int], sleep_seconds: float) -> None:
+def run_refresh_mode(
+    client: Any,
+    index_conn: sqlite3.Connection,
+    limit: Optional[int],
+    sleep_seconds: float,
+    workers: int = DEFAULT_FETCH_WORKERS,
+) -> None:
     candidates = get_refresh_candidates()
     remaining_before = len(candidates)
-    total_archived = len(list(ACTIVITIES_DIR.glob("*.json")))
+    total_archived = len(get_archived_ids())
 
     print("Mode: refresh")
     print(f"Archive size: {total_archived}")
@@ -367,7 +451,7 @@ def run_refresh_mode(client: Any, limit: Optional[int], sleep_seconds: float) ->
     if remaining_before == 0:
         print("All activities are already marked recently_refreshed=true.")
         print("Resetting all refresh flags to false for a new cycle...")
-        n_reset = reset_all_refresh_flags()
+        n_reset = reset_all_refresh_flags(index_conn)
         print(f"Reset {n_reset} files.")
         candidates = get_refresh_candidates()
         remaining_before = len(candidates)
@@ -385,17 +469,23 @@ def run_refresh_mode(client: Any, limit: Optional[int], sleep_seconds: float) ->
     n_errors = 0
     index_changed = False
 
+    paths_by_id = {int(path.stem): path for path in candidates}
+
     try:
-        for path in candidates:
-            activity_id = int(path.stem)
-            old_data = load_json(path)
+        for activity_id, detailed, error in iter_fetched_activities(
+            client, paths_by_id, None, workers, sleep_seconds
+        ):
+            path = paths_by_id[activity_id]
 
             try:
-                detailed = client.get_activity(activity_id)
+                if error is not None:
+                    raise error
+
+                old_data = load_json(path)
                 new_data = activity_to_dict(detailed)
                 new_data = merge_local_fields(new_data, old_data)
                 set_recently_refreshed(new_data, True)
-                atomic_write_json(path, new_data)
+                save_activity(index_conn, path, new_data)
 
                 start_date = new_data.get("start_date")
                 update_activity_index_map(
@@ -408,9 +498,6 @@ def run_refresh_mode(client: Any, limit: Optional[int], sleep_seconds: float) ->
                 n_processed += 1
                 n_written += 1
 
-                if sleep_seconds > 0:
-                    time.sleep(sleep_seconds)
-
                 if n_written % 25 == 0:
                     print(f"Refreshed {n_written}")
 
@@ -432,11 +519,17 @@ def run_refresh_mode(client: Any, limit: Optional[int], sleep_seconds: float) ->
 
     if remaining_after == 0:
         print("Refresh cycle complete. Resetting all recently_refreshed flags to false...")
-        n_reset = reset_all_refresh_flags()
+        n_reset = reset_all_refresh_flags(index_conn)
         print(f"Reset {n_reset} files for the next cycle.")
 
 
-def run_sync_mode(client: Any, limit: Optional[int], sleep_seconds: float) -> None:
+def run_sync_mode(
+    client: Any,
+    index_conn: sqlite3.Connection,
+    limit: Optional[int],
+    sleep_seconds: float,
+    workers: int = DEFAULT_FETCH_WORKERS,
+) -> None:
     """
     Incremental sync for new activities only.
 
@@ -444,7 +537,7 @@ def run_sync_mode(client: Any, limit: Optional[int], sleep_seconds: float) -> No
     Once the archive has data, it only lists activities after the newest
     archived start_date.
     """
-    _, newest = get_archive_bounds(ACTIVITIES_DIR)
+    _, newest = get_archive_bounds(index_conn)
 
     list_kwargs: dict[str, Any] = {}
 
@@ -458,32 +551,43 @@ def run_sync_mode(client: Any, limit: Optional[int], sleep_seconds: float) -> No
 
     activities_iter = client.get_activities(**list_kwargs)
     index_map = load_activity_index_map()
+    existing_ids = get_archived_ids()
 
     n_listed = 0
     n_written = 0
     first = True
     index_changed = False
 
+    listed_ids = (act.id for act in activities_iter)
+
+    def remaining() -> int:
+        return limit - n_written
+
     try:
-        for act in activities_iter:
-            if limit is not None and n_written >= limit:
-                break
+        for activity_id, detailed, error in iter_fetched_activities(
+            client,
+            listed_ids,
+            remaining if limit is not None else None,
+            workers,
+            sleep_seconds,
+        ):
+            if error is not None:
+                raise error
 
             n_listed += 1
-            activity_id = act.id
             out_path = ACTIVITIES_DIR / f"{activity_id}.json"
 
             if first:
                 print("First listed activity id:", activity_id)
                 first = False
 
-            old_data = load_json(out_path) if out_path.exists() else None
+            old_data = load_json(out_path) if str(activity_id) in existing_ids else None
 
-            detailed = client.get_activity(activity_id)
             data = activity_to_dict(detailed)
             data = merge_local_fields(data, old_data)
 
-            atomic_write_json(out_path, data)
+            save_activity(index_conn, out_path, data)
+            existing_ids.add(str(activity_id))
 
             start_date = data.get("start_date")
             update_activity_index_map(
@@ -495,9 +599,6 @@ def run_sync_mode(client: Any, limit: Optional[int], sleep_seconds: float) -> No
 
             n_written += 1
 
-            if sleep_seconds > 0:
-                time.sleep(sleep_seconds)
-
             if n_written % 25 == 0:
                 print(f"Listed {n_listed} | wrote {n_written}")
 
@@ -526,7 +627,13 @@ def main() -> None:
         "--sleep",
         type=float,
         default=0.0,
-        help="Seconds to sleep after each successful write",
+        help="Seconds to wait between activity detail requests",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_FETCH_WORKERS,
+        help=f"Activity detail requests to keep in flight (default: {DEFAULT_FETCH_WORKERS})",
     )
     parser.add_argument(
         "--refresh",
@@ -547,12 +654,13 @@ def main() -> None:
     client = get_client()
     ACTIVITIES_DIR.mkdir(parents=True, exist_ok=True)
 
-    if args.refresh:
-        run_refresh_mode(client, args.limit, args.sleep)
-    elif args.backfill:
-        run_backfill_mode(client, args.limit, args.sleep)
-    else:
-        run_sync_mode(client, args.limit, args.sleep)
+    with closing(index_db.connect()) as index_conn:
+        if args.refresh:
+            run_refresh_mode(client, index_conn, args.limit, args.sleep, args.workers)
+        elif args.backfill:
+            run_backfill_mode(client, index_conn, args.limit, args.sleep, args.workers)
+        else:
+            run_sync_mode(client, index_conn, args.limit, args.sleep, args.workers)
 
 
 if __name__ == "__main__":
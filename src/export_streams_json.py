@@ -27,13 +27,13 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import time
 from pathlib import Path
 from typing import Any, Optional
 
 from client import get_client
 
+from activity_archive.jsonio import atomic_write_json, read_json
 from activity_archive.paths import ACTIVITIES_DIR, STREAMS_DIR
 
 
@@ -52,21 +52,9 @@ ALL_STREAM_TYPES = [
 ]
 
 
-def atomic_write_json(path: Path, data: dict[str, Any]) -> None:
-    """
-    Write JSON to path atomically: write to .tmp then rename.
-    Prevents partial files on Ctrl-C / crashes.
-    """
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
-    tmp_path.replace(path)
-
-
 def load_json(path: Path) -> Optional[dict[str, Any]]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = read_json(path)
         return data if isinstance(data, dict) else None
     except Exception:
         return None
@@ -16,12 +16,13 @@ Walks / hikes / rides include distance only.
 from __future__ import annotations
 
 from datetime import datetime
+from operator import itemgetter
 
 from activity_archive.archive import iter_activity_dicts
 from activity_archive.activity import (
+    RUN_TYPES,
     activity_start_local,
     activity_type,
-    is_run,
 )
 from activity_archive.units import (
     safe_float,
@@ -35,64 +36,46 @@ from activity_archive.paths import ACTIVITIES_DIR, ACTIVITY_LOG_PATH
 
 DELIM = " -- "
 
+# Line templates with DELIM baked in: date, type, miles[, pace, time].
+NONRUN_TEMPLATE = f"{{}}{DELIM}{{:<4}}{DELIM}{{:>5.2f}}"
+RUN_TEMPLATE = f"{NONRUN_TEMPLATE}{DELIM}{{:>5}}/mi{DELIM}{{:>6}}min"
 
-def pad_left(s: str, width: int) -> str:
-    return s.rjust(width)
 
+def format_line(dt: datetime, a: dict) -> str:
+    date_str = dt.date().isoformat()
+    type_str = activity_type(a)
+    dist_mi = meters_to_miles(safe_float(a.get("distance")))
 
-def pad_right(s: str, width: int) -> str:
-    return s.ljust(width)
+    if type_str in RUN_TYPES:
+        moving_seconds = safe_int(a.get("moving_time"))
+        pace = pace_mmss(dist_mi, moving_seconds)
+        time_mmss = seconds_to_mmss(moving_seconds)
+
+        return RUN_TEMPLATE.format(date_str, type_str, dist_mi, pace, time_mmss)
+
+    return NONRUN_TEMPLATE.format(date_str, type_str, dist_mi)
 
 
 def main() -> None:
     if not ACTIVITIES_DIR.exists():
         raise FileNotFoundError(f"Missing archive directory: {ACTIVITIES_DIR}")
 
-    activities: list[tuple[datetime, dict]] = []
+    # Format each line as activities stream in and keep only (start, line),
+    # so full activity dicts (maps, laps, ...) aren't all held until the sort.
+    entries: list[tuple[datetime, str]] = []
 
     for a in iter_activity_dicts(ACTIVITIES_DIR):
         dt = activity_start_local(a)
         if dt is None:
             continue
-        activities.append((dt, a))
-
-    activities.sort(key=lambda x: x[0], reverse=True)
-
-    lines: list[str] = []
-
-    for dt, a in activities:
-        date_str = dt.date().isoformat()
-
-        type_str = activity_type(a)
-        type_col = pad_right(type_str, 4)
-
-        meters = safe_float(a.get("distance"))
-        dist_mi = meters_to_miles(meters)
-        dist_col = f"{dist_mi:>5.2f}"
-
-        if is_run(a):
-            moving_seconds = safe_int(a.get("moving_time"))
-
-            pace = pace_mmss(dist_mi, moving_seconds)
-            time_mmss = seconds_to_mmss(moving_seconds)
-
-            pace_col = pad_left(pace, 5) + "/mi"
-            time_col = pad_left(time_mmss, 6) + "min"
+        entries.append((dt, format_line(dt, a)))
 
-            line = (
-                f"{date_str}"
-                f"{DELIM}{type_col}"
-                f"{DELIM}{dist_col}"
-                f"{DELIM}{pace_col}"
-                f"{DELIM}{time_col}"
-            )
-        else:
-            line = f"{date_str}{DELIM}{type_col}{DELIM}{dist_col}"
+    entries.sort(key=itemgetter(0), reverse=True)
 
-        lines.append(line)
+    lines = [line for _, line in entries]
 
     ACTIVITY_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    ACTIVITY_LOG_PATH.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    ACTIVITY_LOG_PATH.write_bytes(("\n".join(lines) + "\n").encode("utf-8"))
 
     print(f"Wrote {len(lines)} lines to {ACTIVITY_LOG_PATH}")
 
@@ -11,6 +11,7 @@ Outputs:
 Design:
 - JSON-first: NO Strava API calls.
 - Deterministic: always rebuild the full CSV from local JSON files.
+- Leaves the file untouched when the rebuilt content is identical.
 - Works even if some fields are missing/null.
 """
 
@@ -18,11 +19,13 @@ from __future__ import annotations
 
 import csv
 from datetime import datetime
+import io
+from operator import itemgetter
 
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
-from activity_archive.archive import count_json_files, iter_activity_dicts
-from activity_archive.activity import activity_type, parse_iso_datetime, is_run
+from activity_archive.archive import load_activity_dict, map_archive_files_cpu
+from activity_archive.activity import RUN_TYPES, activity_type, parse_iso_datetime
 from activity_archive.units import (
     meters_to_feet,
     meters_to_miles,
@@ -61,10 +64,11 @@ FIELDNAMES = [
 def hhmmss(dt: Optional[datetime]) -> str:
     if not dt:
         return ""
-    return dt.strftime("%H:%M:%S")
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
 
 
-def activity_to_row(a: dict[str, Any]) -> Dict[str, Any]:
+def activity_to_row(a: dict[str, Any]) -> Tuple[Any, ...]:
+    """Build one CSV row, with values in FIELDNAMES order."""
     activity_id = str(a.get("id") or "")
 
     typ = activity_type(a)
@@ -93,60 +97,74 @@ def activity_to_row(a: dict[str, Any]) -> Dict[str, Any]:
     pace_str = ""
     pace_min_per_mi = ""
 
-    if is_run(a) and distance_mi > 0 and moving_seconds > 0:
+    if typ in RUN_TYPES and distance_mi > 0 and moving_seconds > 0:
         pace_str = pace_mmss(distance_mi, moving_seconds)
         pace_min_per_mi = round(
             (moving_seconds / distance_mi) / 60.0,
             PACE_DECIMALS,
         )
 
-    return {
-        "id": activity_id,
-        "date_local": date_local,
-        "start_time_local": time_local,
-        "type": typ,
-        "distance_mi": round(distance_mi, DISTANCE_MI_DECIMALS) if distance_mi > 0 else "",
-        "moving_time_min": (round(moving_min, MOVING_MIN_DECIMALS) if moving_min > 0 else ""),
-        "elapsed_time_min": (round(elapsed_min, ELAPSED_MIN_DECIMALS) if elapsed_min > 0 else ""),
-        "total_elev_gain_ft": round(elev_ft, ELEV_FT_DECIMALS) if elev_ft > 0 else "",
-        "avg_speed_mph": (round(avg_speed_mph, SPEED_MPH_DECIMALS) if avg_speed_mph > 0 else ""),
-        "pace_mmss": pace_str,
-        "pace_min_per_mi": pace_min_per_mi,
-        "name": (a.get("name") or "").strip(),
-    }
+    return (
+        activity_id,
+        date_local,
+        time_local,
+        typ,
+        round(distance_mi, DISTANCE_MI_DECIMALS) if distance_mi > 0 else "",
+        round(moving_min, MOVING_MIN_DECIMALS) if moving_min > 0 else "",
+        round(elapsed_min, ELAPSED_MIN_DECIMALS) if elapsed_min > 0 else "",
+        round(elev_ft, ELEV_FT_DECIMALS) if elev_ft > 0 else "",
+        round(avg_speed_mph, SPEED_MPH_DECIMALS) if avg_speed_mph > 0 else "",
+        pace_str,
+        pace_min_per_mi,
+        (a.get("name") or "").strip(),
+    )
+
+
+def csv_line(row: Sequence[Any]) -> str:
+    buf = io.StringIO(newline="")
+    csv.writer(buf).writerow(row)
+    return buf.getvalue()
+
+
+def _load_row(path: str) -> Optional[Tuple[str, str, str, str]]:
+    """(date_local, start_time_local, id, CSV line) for one archive file."""
+    a = load_activity_dict(path)
+    if a is None:
+        return None
+    row = activity_to_row(a)
+    return (row[1], row[2], row[0], csv_line(row))
 
 
 def main() -> None:
     if not ACTIVITIES_DIR.exists():
         raise SystemExit(f"Archive dir not found: {ACTIVITIES_DIR}")
 
-    ACTIVITIES_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
-
-    total_files = count_json_files(ACTIVITIES_DIR)
-    rows: List[Dict[str, Any]] = []
+    # Rows arrive already formatted, so CSV quoting runs in the workers too.
+    rows: List[Tuple[str, str, str, str]] = []
+    total_files = 0
 
-    for a in iter_activity_dicts(ACTIVITIES_DIR):
-        row = activity_to_row(a)
-        if row.get("id"):
+    # One result per *.json file (None if unreadable), so count files here
+    # instead of listing the directory a second time.
+    for row in map_archive_files_cpu(_load_row, ACTIVITIES_DIR):
+        total_files += 1
+        if row is not None and row[2]:
             rows.append(row)
 
-    rows.sort(
-        key=lambda r: (
-            str(r.get("date_local") or ""),
-            str(r.get("start_time_local") or ""),
-            str(r.get("id") or ""),
-        ),
-        reverse=True,
-    )
+    # (date_local, start_time_local, id); all three are always strings.
+    rows.sort(key=itemgetter(0, 1, 2), reverse=True)
 
     ACTIVITIES_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(ACTIVITIES_CSV_PATH, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=FIELDNAMES)
-        w.writeheader()
-        w.writerows(rows)
 
-    print(f"Wrote {len(rows)} activities to {ACTIVITIES_CSV_PATH}")
-    skipped = total_files - len({r["id"] for r in rows if r.get("id")})
+    content = (csv_line(FIELDNAMES) + "".join([r[3] for r in rows])).encode("utf-8")
+
+    # Incremental syncs usually leave the CSV unchanged; skip the rewrite then.
+    if ACTIVITIES_CSV_PATH.exists() and ACTIVITIES_CSV_PATH.read_bytes() == content:
+        print(f"{ACTIVITIES_CSV_PATH} is up to date ({len(rows)} activities)")
+    else:
+        ACTIVITIES_CSV_PATH.write_bytes(content)
+        print(f"Wrote {len(rows)} activities to {ACTIVITIES_CSV_PATH}")
+
+    skipped = total_files - len({r[2] for r in rows})
     if skipped > 0:
         print(f"Note: {skipped} file(s) were unreadable/non-dict/duplicate-id and were skipped.")
 
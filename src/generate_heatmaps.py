@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
 import folium
 import polyline
 
+from activity_archive.jsonio import read_json
 from activity_archive.paths import ACTIVITIES_DIR, HEATMAPS_DIR
 
 PORTLAND_CENTER = [45.5231, -122.6765]
@@ -60,8 +60,7 @@ def iter_activity_files() -> list[Path]:
 
 def load_json(path: Path) -> dict[str, Any] | None:
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(path)
         return data if isinstance(data, dict) else None
     except Exception:
         return None
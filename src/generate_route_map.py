@@ -20,7 +20,6 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 
@@ -28,6 +27,7 @@ import polyline
 from staticmap import CircleMarker, Line, StaticMap
 
 
+from activity_archive.jsonio import read_json
 from activity_archive.paths import ACTIVITIES_DIR, MAPS_DIR
 
 
@@ -37,8 +37,7 @@ START_END_MARKER_SIZE = 12
 
 
 def load_json(path: Path) -> dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(path)
     if not isinstance(data, dict):
         raise ValueError(f"Expected JSON object in {path}")
     return data
@@ -20,18 +20,17 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 import polyline
 from PIL import Image, ImageDraw
 
+from activity_archive.jsonio import read_json
 from activity_archive.paths import ACTIVITIES_DIR, THUMBNAILS_DIR
 
 
 def load_json(path: Path) -> dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(path)
     if not isinstance(data, dict):
         raise ValueError(f"Expected JSON object in {path}")
     return data
@@ -19,21 +19,8 @@ Design:
 
 from __future__ import annotations
 
-from collections import defaultdict
-from dataclasses import dataclass
-from datetime import date
-from pathlib import Path
-
-from activity_archive.activity import is_run, parse_iso_datetime
-from activity_archive.archive import iter_activity_dicts
-from activity_archive.units import (
-    meters_to_miles,
-    pace_mmss,
-    safe_float,
-    safe_int,
-    seconds_to_hhmmss,
-    seconds_to_mmss,
-)
+from activity_archive.runs import MONTH_NAMES, RunRow, load_runs_by_month
+from activity_archive.units import seconds_to_hhmmss, seconds_to_mmss
 
 from activity_archive.paths import ACTIVITIES_DIR, RUNS_LOG_PATH
 
@@ -41,77 +28,28 @@ from activity_archive.paths import ACTIVITIES_DIR, RUNS_LOG_PATH
 DELIM = " -- "
 SEP = "-" * 46
 BIG_SEP = "=" * 46
+# Run line template with DELIM baked in: date, miles, pace column, time.
+RUN_TEMPLATE = f"{{}}{DELIM}{{:>5.2f}}mi{DELIM}{{}}{DELIM}{{:>6}}min"
 
 
-def pad_left(s: str, width: int) -> str:
-    return s.rjust(width)
-
-
-@dataclass(frozen=True)
-class RunRow:
-    date_str: str
-    dist_mi: float
-    pace_mmss: str
-    moving_seconds: int
-
-
-def load_runs_by_month(activities_dir: Path) -> dict[tuple[int, int], list[RunRow]]:
-    if not activities_dir.exists():
-        raise FileNotFoundError(f"Missing activities archive dir: {activities_dir}")
-
-    by_month: dict[tuple[int, int], list[RunRow]] = defaultdict(list)
-
-    for activity in iter_activity_dicts(activities_dir):
-        if not is_run(activity):
-            continue
-
-        dt_local = parse_iso_datetime(activity.get("start_date_local")) or parse_iso_datetime(
-            activity.get("start_date")
-        )
-        if dt_local is None:
-            continue
-
-        d = dt_local.date()
-
-        meters = safe_float(activity.get("distance"))
-        dist_mi = meters_to_miles(meters)
-
-        moving_seconds = safe_int(activity.get("moving_time"))
-        pace = pace_mmss(dist_mi, moving_seconds)
-
-        by_month[(d.year, d.month)].append(
-            RunRow(
-                date_str=d.strftime("%Y-%m-%d"),
-                dist_mi=dist_mi,
-                pace_mmss=pace,
-                moving_seconds=moving_seconds,
-            )
-        )
-
-    return by_month
-
-
-def render_month_block(year: int, month: int, runs: list[RunRow]) -> list[str]:
-    month_name = date(year, month, 1).strftime("%B %Y")
+def render_month_block(year: int, month: int, runs: list[RunRow]) -> str:
+    month_name = f"{MONTH_NAMES[month - 1]} {year}"
     lines: list[str] = [BIG_SEP, month_name, SEP]
 
-    month_runs = sorted(runs, key=lambda rr: rr.date_str, reverse=True)
-
     total_miles = 0.0
     total_seconds = 0
 
-    for rr in month_runs:
-        dist_col = f"{rr.dist_mi:>5.2f}mi"
-        pace_col = pad_left(rr.pace_mmss, 5) + "/mi" if rr.pace_mmss else pad_left("", 5)
-        time_col = pad_left(seconds_to_mmss(rr.moving_seconds), 6) + "min"
+    for rr in runs:
+        pace_col = f"{rr.pace_mmss:>5}/mi" if rr.pace_mmss else " " * 5
+        time_mmss = seconds_to_mmss(rr.moving_seconds)
 
-        lines.append(f"{rr.date_str}{DELIM}{dist_col}{DELIM}{pace_col}{DELIM}{time_col}")
+        lines.append(RUN_TEMPLATE.format(rr.date_str, rr.dist_mi, pace_col, time_mmss))
 
         total_miles += rr.dist_mi
         total_seconds += rr.moving_seconds
 
     lines.append(SEP)
-    run_count = len(month_runs)
+    run_count = len(runs)
     lines.append(f"Runs: {run_count}")
     lines.append(f"Miles: {total_miles:.2f}")
     lines.append(f"Time: {seconds_to_hhmmss(total_seconds)}")
@@ -123,19 +61,19 @@ def render_month_block(year: int, month: int, runs: list[RunRow]) -> list[str]:
         lines.append("Pace: N/A")
 
     lines.append("\n")
-    return lines
+    return "\n".join(lines)
 
 
 def main() -> None:
     runs_by_month = load_runs_by_month(ACTIVITIES_DIR)
     month_keys = sorted(runs_by_month.keys(), reverse=True)
 
-    lines: list[str] = []
-    for year, month in month_keys:
-        lines.extend(render_month_block(year, month, runs_by_month[(year, month)]))
+    blocks = [
+        render_month_block(year, month, runs_by_month[(year, month)]) for year, month in month_keys
+    ]
 
     RUNS_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    RUNS_LOG_PATH.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    RUNS_LOG_PATH.write_bytes(("\n".join(blocks).rstrip() + "\n").encode("utf-8"))
 
     print(f"Wrote {len(month_keys)} month blocks to {RUNS_LOG_PATH}")
 